@@ -29,10 +29,18 @@ TradeSkillMaster / CraftSim Addon 설정 파일에서 WOW 자산 정보를 추
 """
 
 import re
+import io
 import json
+import hashlib
+import mmap
 import argparse
+import heapq
 import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
+from operator import itemgetter
 from dotenv import load_dotenv
 import matplotlib
 matplotlib.use("Agg")  # GUI 없는 환경(서버/스크립트)에서 파일로 저장
@@ -42,6 +50,11 @@ from matplotlib import dates as mdates
 from matplotlib import font_manager as fm
 import numpy as np
 
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 JSON 직렬화에 사용
+except ImportError:
+    orjson = None
+
 load_dotenv()  # .env 파일 로드
 
 
@@ -49,31 +62,119 @@ load_dotenv()  # .env 파일 로드
 # Lua 파일 파싱
 # ──────────────────────────────────────────────────────────────────────────────
 
+# 최상위 key = value 라인 형식: ["<key>"] = <value>,
+#   value 가 숫자면 group(2), 문자열(큰따옴표)이면 group(3) 에 매칭된다.
+#   문자열 value 내에 큰따옴표는 없고 이스케이프된 \n 이 있을 수 있음 → [^"]* 로 매칭
+#   key 에도 큰따옴표/개행이 없으므로 lazy (.+?) 대신 [^"\n]+ 로 매칭해
+#   키 길이만큼 종결 패턴을 재시도하는 백트래킹 없이 한 번에 지나가게 한다.
+#   중첩 테이블 { ... } 은 매칭하지 않는다.
+# 파일을 mmap 으로 바이트 그대로 스캔하므로 bytes 패턴을 사용한다.
+_LUA_KV_RE = re.compile(rb'^\["([^"\n]+)"\] = (?:(-?\d+)|"([^"]*)"),\s*$', re.MULTILINE)
+
+
 def parse_lua_file(path: str) -> dict:
     """TradeSkillMaster.lua 파일을 읽어 key-value 쌍의 딕셔너리로 반환합니다."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"Lua 파일을 찾을 수 없습니다: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
+    data = {}
+    if os.path.getsize(path) == 0:
+        return data
+
+    # 파일 전체를 str 로 읽어 디코딩하지 않고, mmap 위에서 바로 정규식으로 스캔한다.
+    # 숫자/문자열 값을 하나의 정규식으로 한 번에 분류하고, 매칭된 부분만 UTF-8 로 디코딩한다.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for m in _LUA_KV_RE.finditer(mm):
+            key = m.group(1).decode("utf-8")
+            num = m.group(2)
+            if num is not None:
+                data[key] = int(num)
+            else:
+                data[key] = m.group(3).decode("utf-8")
 
-    # 최상위 테이블 시작 라인 제거: "TradeSkillMasterDB = {"
-    # 이후 최상위 key = value 쌍을 정규식으로 추출
-    # 형식: ["<key>"] = <value>,
-    #   value 는 숫자, 문자열 (큰따옴표), 또는 중첩 테이블 { ... }
+    return data
 
-    data = {}
 
-    # 숫자 값 추출
-    for m in re.finditer(r'^\["(.+?)"\] = (-?\d+),\s*$', content, re.MULTILINE):
-        data[m.group(1)] = int(m.group(2))
+# ──────────────────────────────────────────────────────────────────────────────
+# 키 분류
+# ──────────────────────────────────────────────────────────────────────────────
 
-    # 문자열 값 추출: ["key"] = "value",
-    # value 내에 큰따옴표는 없고 이스케이프된 \n 이 있을 수 있음 → [^"]* 로 매칭
-    for m in re.finditer(r'^\["(.+?)"\] = "([^"]*)",\s*$', content, re.MULTILINE):
-        data[m.group(1)] = m.group(2)
+# TSM 키는 고정 prefix/suffix 사이에 캐릭터/서버명이 들어가는 형태이므로
+# 정규식 대신 startswith/endswith 비교 후 슬라이스로 가운데 부분을 꺼낸다.
+#   캐릭터별 골드   : s@<char> - <faction> - <realm>@internalData@money
+#   캐릭터별 goldLog: s@<char> - <faction> - <realm>@internalData@goldLog
+#   수입/지출 CSV   : r@<realm>@internalData@csvIncome | csvExpense
+#   전쟁금고 골드/goldLog 는 고정 키를 사용한다.
+_CHAR_PREFIX = "s@"
+_CHAR_MONEY_SUFFIX = "@internalData@money"
+_CHAR_GOLD_LOG_SUFFIX = "@internalData@goldLog"
+_TX_PREFIX = "r@"
+_TX_INCOME_SUFFIX = "@internalData@csvIncome"
+_TX_EXPENSE_SUFFIX = "@internalData@csvExpense"
+_WARBANK_MONEY_KEY = "g@ @internalData@warbankMoney"
+_WARBANK_GOLD_LOG_KEY = "g@ @internalData@warbankGoldLog"
+
+
+def _key_middle(key: str, prefix: str, suffix: str) -> str | None:
+    """key 가 prefix 로 시작하고 suffix 로 끝나면 그 사이 문자열을, 아니면 None 을 반환합니다."""
+    if (
+        len(key) > len(prefix) + len(suffix)
+        and key.startswith(prefix)
+        and key.endswith(suffix)
+    ):
+        return key[len(prefix):-len(suffix)]
+    return None
 
-    return data
+
+def collect_all(raw: dict) -> dict:
+    """
+    파싱된 Lua 딕셔너리를 한 번만 순회하여 자산/골드 이력/수입·지출 추출에 필요한
+    값들을 키 유형별로 분류합니다. extract_* 함수들은 이 결과를 입력으로 사용합니다.
+
+    반환 구조:
+    {
+        "char_money": {"<name> - <faction> - <realm>": int, ...},      # copper
+        "warbank_money": int | None,                                    # copper
+        "char_gold_logs": {"<name> - <faction> - <realm>": str, ...},  # goldLog 원문
+        "warbank_gold_log": str | None,                                 # warbankGoldLog 원문
+        "tx_csvs": [(is_income: bool, csv_str: str), ...],              # 원본 키 순서 유지
+    }
+    """
+    collected = {
+        "char_money": {},
+        "warbank_money": None,
+        "char_gold_logs": {},
+        "warbank_gold_log": None,
+        "tx_csvs": [],
+    }
+
+    for key, value in raw.items():
+        if isinstance(value, int):
+            if key == _WARBANK_MONEY_KEY:
+                collected["warbank_money"] = value
+                continue
+            char_name = _key_middle(key, _CHAR_PREFIX, _CHAR_MONEY_SUFFIX)
+            if char_name is not None:
+                collected["char_money"][char_name] = value
+            continue
+
+        if not isinstance(value, str):
+            continue
+
+        if key.startswith(_CHAR_PREFIX):
+            char_name = _key_middle(key, _CHAR_PREFIX, _CHAR_GOLD_LOG_SUFFIX)
+            if char_name is not None:
+                collected["char_gold_logs"][char_name] = value
+        elif key.startswith(_TX_PREFIX):
+            # csvIncome(수입/일반) 및 csvExpense(지출/수리비 등) 모두 수집
+            if _key_middle(key, _TX_PREFIX, _TX_INCOME_SUFFIX) is not None:
+                collected["tx_csvs"].append((True, value))
+            elif _key_middle(key, _TX_PREFIX, _TX_EXPENSE_SUFFIX) is not None:
+                collected["tx_csvs"].append((False, value))
+        elif key == _WARBANK_GOLD_LOG_KEY:
+            collected["warbank_gold_log"] = value
+
+    return collected
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -81,13 +182,48 @@ def parse_lua_file(path: str) -> dict:
 # ──────────────────────────────────────────────────────────────────────────────
 
 def copper_to_gold(copper: int) -> float:
-    """copper 단위를 골드 단위로 변환합니다."""
+    """
+    copper 단위를 골드 단위로 변환합니다.
+    정수 copper / 10000 은 이미 소수점 4자리 값에 가장 가까운 float 이므로 round(..., 4) 가 필요 없습니다.
+    """
     return copper / 10000
 
 
-def extract_assets(raw: dict) -> dict:
+# UTC 일(day) 인덱스(ts // 86400) → 'YYYY-MM-DD' 캐시
+_DAY_CACHE: dict[int, str] = {}
+
+
+def _civil_from_days(days: int) -> tuple[int, int, int]:
+    """
+    1970-01-01 기준 경과 일수를 (연, 월, 일)로 변환합니다.
+    datetime 객체 없이 정수 연산만 사용합니다. (Howard Hinnant 의 civil_from_days 알고리즘)
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097                                         # [0, 146096]
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365  # [0, 399]
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)                # [0, 365]
+    mp = (5 * doy + 2) // 153                                      # [0, 11], 3월 시작
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+    y = yoe + era * 400 + (m <= 2)
+    return y, m, d
+
+
+def _day_str(ts: int) -> str:
+    """Unix 타임스탬프(초)를 'YYYY-MM-DD' (UTC 기준) 문자열로 변환합니다. 일 단위로 캐시합니다."""
+    day = ts // 86400
+    date_str = _DAY_CACHE.get(day)
+    if date_str is None:
+        y, m, d = _civil_from_days(day)
+        date_str = f"{y:04d}-{m:02d}-{d:02d}"
+        _DAY_CACHE[day] = date_str
+    return date_str
+
+
+def extract_assets(collected: dict) -> dict:
     """
-    파싱된 Lua 딕셔너리에서 현재 자산 정보를 추출합니다.
+    collect_all() 로 분류된 값에서 현재 자산 정보를 추출합니다.
     골드 미만 실버/코퍼 정보는 포함하지 않습니다.
 
     반환 구조:
@@ -112,71 +248,243 @@ def extract_assets(raw: dict) -> dict:
         "total_gold": 0.0,
     }
 
-    # 캐릭터별 골드: 키 형식 → s@<char> - <faction> - <realm>@internalData@money
-    char_money_pattern = re.compile(
-        r"^s@(.+?)@internalData@money$"
-    )
-
     total_copper = 0
-    for key, value in raw.items():
-        m = char_money_pattern.match(key)
-        if m and isinstance(value, int):
-            char_name = m.group(1)
-            assets["characters"][char_name] = {
-                "money_gold": round(copper_to_gold(value), 4),
-            }
-            total_copper += value
+    for char_name, value in collected["char_money"].items():
+        assets["characters"][char_name] = {
+            "money_gold": copper_to_gold(value),
+        }
+        total_copper += value
 
-    # 전쟁금고 (Warbank): 키 형식 → g@ @internalData@warbankMoney
-    warbank_key = "g@ @internalData@warbankMoney"
-    if warbank_key in raw and isinstance(raw[warbank_key], int):
-        wb_copper = raw[warbank_key]
+    # 전쟁금고 (Warbank)
+    wb_copper = collected["warbank_money"]
+    if wb_copper is not None:
         assets["warbank"] = {
-            "money_gold": round(copper_to_gold(wb_copper), 4),
+            "money_gold": copper_to_gold(wb_copper),
         }
         total_copper += wb_copper
 
-    assets["total_gold"] = round(copper_to_gold(total_copper), 4)
+    assets["total_gold"] = copper_to_gold(total_copper)
 
     return assets
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# JSON 파일 저장
+# ──────────────────────────────────────────────────────────────────────────────
+
+# 일별 JSON 파일 쓰기에 사용할 스레드 수 (파일 I/O 대기 중에는 GIL 이 해제됨)
+_WRITE_WORKERS = 16
+
+# 이전 실행에서 저장한 파일별 해시/크기/수정 시각 (output_dir 기준)
+_WRITE_CACHE_FILE = ".write_cache.json"
+
+
+def _serialize_json(payload: dict) -> bytes:
+    """
+    payload 를 저장할 JSON 바이트열(UTF-8, 들여쓰기 2칸)로 직렬화합니다.
+    orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 모듈을 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def load_write_cache(output_dir: str) -> dict:
+    """
+    output_dir/.write_cache.json 에서 이전 실행 때 저장한 파일별 정보를 읽어옵니다.
+    파일이 없거나 읽을 수 없으면 빈 딕셔너리를 반환하고,
+    형식이 맞지 않는 항목은 버려서 해당 파일은 캐시 미스로 처리합니다.
+
+    구조: {"<output_dir 기준 상대 경로>": [sha256 hex, 파일 크기, mtime_ns], ...}
+    """
+    path = os.path.join(output_dir, _WRITE_CACHE_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        relpath: entry
+        for relpath, entry in cache.items()
+        if isinstance(entry, list) and len(entry) == 3
+    }
+
+
+def save_write_cache(write_cache: dict, output_dir: str) -> None:
+    """파일별 해시 정보를 output_dir/.write_cache.json 에 저장합니다."""
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, _WRITE_CACHE_FILE), "w", encoding="utf-8") as f:
+        json.dump(write_cache, f, ensure_ascii=False)
+
+
+def _write_json_file(
+    path: str,
+    payload: dict,
+    write_cache: dict | None = None,
+    cache_key: str = "",
+) -> None:
+    """
+    payload 를 path 에 JSON 으로 저장합니다. 내용이 바뀌지 않았으면 다시 쓰지 않습니다.
+    - write_cache 에 같은 해시가 있고 파일 크기/수정 시각도 그대로면 파일을 열지 않고 건너뜁니다.
+    - 그 외에는 크기가 같을 때만 기존 내용을 읽어 비교합니다.
+    """
+    data = _serialize_json(payload)
+    digest = hashlib.sha256(data).hexdigest() if write_cache is not None else ""
+
+    if write_cache is not None:
+        entry = write_cache.get(cache_key)
+        if entry and entry[0] == digest:
+            try:
+                st = os.stat(path)
+                if [st.st_size, st.st_mtime_ns] == entry[1:]:
+                    return
+            except OSError:
+                pass
+
+    unchanged = False
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                unchanged = f.read() == data
+    except OSError:
+        pass
+    if not unchanged:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    if write_cache is not None:
+        st = os.stat(path)
+        write_cache[cache_key] = [digest, st.st_size, st.st_mtime_ns]
+
+
+def _write_json_files(
+    files: list[tuple[str, dict]],
+    output_dir: str,
+    write_cache: dict | None = None,
+) -> list[str]:
+    """
+    (경로, payload) 목록을 JSON 파일로 저장하고, 저장한 파일 경로 리스트를 반환합니다.
+    - 상위 디렉토리는 중복 없이 한 번씩만 생성합니다.
+    - 파일 쓰기는 스레드 풀에서 병렬로 수행합니다.
+    - 같은 경로가 여러 번 나오면 마지막 payload 로 저장합니다.
+    - write_cache 가 주어지면 output_dir 기준 상대 경로를 키로 해시 정보를 갱신합니다.
+    """
+    for dir_path in {os.path.dirname(path) for path, _ in files}:
+        os.makedirs(dir_path, exist_ok=True)
+
+    latest = dict(files)
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                _write_json_file, path, payload, write_cache, os.path.relpath(path, output_dir)
+            )
+            for path, payload in latest.items()
+        ]
+        for future in futures:
+            future.result()
+    return [path for path, _ in files]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 일별 골드 이력 추출 (goldLog / warbankGoldLog)
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _parse_gold_log_rows(body: str) -> np.ndarray:
+    """
+    goldLog 본문을 라인 단위로 파싱하여 (minute, copper) int64 배열로 반환합니다.
+    형식이 잘못된 라인은 건너뜁니다. (parse_gold_log 의 느린 대체 경로)
+    """
+    rows = []
+    for line in body.split("\n"):
+        parts = line.split(",")
+        if len(parts) != 2:
+            continue
+        try:
+            rows.append((int(parts[0]), int(parts[1])))
+        except ValueError:
+            continue
+    return np.array(rows, dtype=np.int64).reshape(-1, 2)
+
+
 def parse_gold_log(log_str: str) -> list[tuple[str, int]]:
     """
     goldLog 문자열("minute,copper\n...")을 파싱하여 (date_str, copper_amount) 리스트로 반환합니다.
     - minute: Unix 타임스탬프 // 60
     - copper_amount: copper 단위 보유량 (골드 변환 시 10000으로 나눔)
     - date_str: 'YYYY-MM-DD' (UTC 기준)
+    같은 날짜에 여러 기록이 있으면 마지막 기록값만 남기며, 날짜 오름차순으로 반환합니다.
     """
     # Lua 파일에서 개행 문자가 리터럴 \n 으로 저장되어 있으므로 변환
     log_str = log_str.replace("\\n", "\n")
-    lines = log_str.strip().split("\n")
-    if not lines or lines[0].strip() != "minute,copper":
+    header, _, body = log_str.strip().partition("\n")
+    if header.strip() != "minute,copper" or not body.strip():
         return []
 
-    result = []
-    for line in lines[1:]:
-        parts = line.split(",")
-        if len(parts) != 2:
-            continue
-        try:
-            minute = int(parts[0])
-            copper = int(parts[1])
-        except ValueError:
+    # 전체 본문을 NumPy 로 한 번에 파싱하고, 잘못된 라인이 섞여 있으면 라인 단위로 파싱
+    try:
+        rows = np.loadtxt(
+            io.StringIO(body), delimiter=",", dtype=np.int64, comments=None, ndmin=2
+        )
+    except ValueError:
+        rows = _parse_gold_log_rows(body)
+    if rows.shape[0] == 0 or rows.shape[1] != 2:
+        return []
+
+    # 일(day) 인덱스 = minute // (24 * 60)
+    # 역순 배열에서 각 날짜의 첫 위치 = 원래 순서에서 그 날짜의 마지막 기록
+    days = rows[:, 0] // 1440
+    unique_days, rev_idx = np.unique(days[::-1], return_index=True)
+    last_coppers = rows[len(days) - 1 - rev_idx, 1]
+
+    return [
+        (_day_str(day * 86400), copper)
+        for day, copper in zip(unique_days.tolist(), last_coppers.tolist())
+    ]
+
+
+def _char_key(tsm_key: str) -> str:
+    """TSM 키 "CharName - Faction - ServerName" 을 "캐릭명-서버명" 형태로 변환합니다."""
+    parts = tsm_key.split(" - ")
+    if len(parts) == 3:
+        return f"{parts[0]}-{parts[2]}"
+    return tsm_key
+
+
+def _forward_fill(
+    dates: list[str], timelines: list[list[tuple[str, int]]]
+) -> np.ndarray:
+    """
+    소스별 (날짜, copper) 시계열을 (len(dates) × 소스 수) int64 행렬로 펼칩니다.
+
+    기록이 없는 날은 직전 기록값을 이월하고, 첫 기록 이전은 0 으로 채웁니다.
+    각 시계열의 날짜는 모두 dates 에 포함되어 있어야 합니다.
+    """
+    n_dates, n_src = len(dates), len(timelines)
+    # 0 번 행은 "기록 이전" 을 나타내는 0 값 행
+    values = np.zeros((n_dates + 1, n_src), dtype=np.int64)
+    present = np.zeros((n_dates + 1, n_src), dtype=bool)
+    present[0] = True
+
+    date_arr = np.array(dates)
+    for col, timeline in enumerate(timelines):
+        if not timeline:
             continue
-        ts = minute * 60
-        date_str = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
-        result.append((date_str, copper))
-    return result
+        days, coppers = zip(*timeline)
+        rows = np.searchsorted(date_arr, days) + 1
+        values[rows, col] = coppers
+        present[rows, col] = True
+
+    # 각 칸에서 가장 최근 기록이 있는 행 번호를 누적 최대값으로 구해 값을 끌어온다
+    last_row = np.where(present, np.arange(n_dates + 1)[:, None], 0)
+    np.maximum.accumulate(last_row, axis=0, out=last_row)
+    return values[last_row, np.arange(n_src)][1:]
 
 
-def extract_daily_gold_history(raw: dict) -> dict:
+def extract_daily_gold_history(collected: dict) -> dict:
     """
-    설정 파일 내 모든 goldLog / warbankGoldLog 를 파싱하여
+    collect_all() 로 분류된 모든 goldLog / warbankGoldLog 를 파싱하여
     일별 총 골드 이력을 반환합니다.
 
     접속 기록이 없는 날은 가장 최근 기록값을 이월(forward-fill)하므로
@@ -197,114 +505,74 @@ def extract_daily_gold_history(raw: dict) -> dict:
         ...
     }
     """
-    # 소스별 (날짜 → copper) 시계열 수집
-    # source_key: "char:<name>" or "warbank"
-    # source_timeline[source_key] = sorted list of (date_str, copper)
-    source_timeline: dict[str, list[tuple[str, int]]] = {}
-
-    char_log_pattern = re.compile(r"^s@(.+?)@internalData@goldLog$")
-
-    for key, value in raw.items():
-        if not isinstance(value, str):
-            continue
-
-        source = None
-        if char_log_pattern.match(key):
-            source = "char:" + char_log_pattern.match(key).group(1)
-        elif key == "g@ @internalData@warbankGoldLog":
-            source = "warbank"
-
-        if source is None:
-            continue
-
-        entries = parse_gold_log(value)
-        if not entries:
-            continue
-
-        if source not in source_timeline:
-            source_timeline[source] = {}
+    # 소스별 (날짜, copper) 시계열 수집
+    # 소스마다 goldLog 는 하나이고, parse_gold_log 가 이미 날짜별 마지막 값만
+    # 날짜순으로 돌려주므로 그대로 사용한다.
+    # char_sorted[<TSM 캐릭터 키>] = sorted list of (date_str, copper)
+    char_sorted: dict[str, list[tuple[str, int]]] = {}
+    for char_name, log_str in collected["char_gold_logs"].items():
+        entries = parse_gold_log(log_str)
+        if entries:
+            char_sorted[char_name] = entries
+
+    wb_log = collected["warbank_gold_log"]
+    wb_sorted: list[tuple[str, int]] = (
+        parse_gold_log(wb_log) if wb_log is not None else []
+    )
 
-        # 같은 날짜에 여러 기록이 있으면 마지막 값(append 순서)으로 덮어씀
-        for date_str, copper in entries:
-            source_timeline[source][date_str] = copper
+    # TSM 캐릭터 키 → "캐릭명-서버명" 표시 이름 (날짜와 무관하므로 한 번만 계산)
+    char_labels: list[str] = [_char_key(name) for name in char_sorted]
 
-    # 각 소스의 날짜 맵을 정렬된 리스트로 변환
-    source_sorted: dict[str, list[tuple[str, int]]] = {
-        src: sorted(date_map.items())
-        for src, date_map in source_timeline.items()
-    }
-
-    # 전체 날짜 범위 산출
-    all_dates: list[str] = sorted(
-        {d for timeline in source_sorted.values() for d, _ in timeline}
+    # 기록이 있는 모든 날짜 (정렬됨)
+    dates = sorted(
+        {date_str for timeline in char_sorted.values() for date_str, _ in timeline}
+        | {date_str for date_str, _ in wb_sorted}
     )
-    if not all_dates:
+    if not dates:
         return {}
 
-    # forward-fill: 날짜별로 각 소스의 "해당 날 이전 마지막 기록값" 계산
-    history: dict[str, dict] = {}
-    # 소스별 인덱스 포인터
-    pointers: dict[str, int] = {src: 0 for src in source_sorted}
-    # 소스별 현재(이월) 값
-    current_vals: dict[str, int] = {src: 0 for src in source_sorted}
-
-    for date_str in all_dates:
-        # 각 소스에서 이 날짜까지 기록된 최신 값으로 갱신
-        for src, timeline in source_sorted.items():
-            idx = pointers[src]
-            while idx < len(timeline) and timeline[idx][0] <= date_str:
-                current_vals[src] = timeline[idx][1]
-                idx += 1
-            pointers[src] = idx
-
-        char_copper = sum(
-            v for k, v in current_vals.items() if k.startswith("char:")
-        )
-        wb_copper = current_vals.get("warbank", 0)
-        total_copper = char_copper + wb_copper
-
-        # 캐릭터별 상세 (정수 골드만 저장, 실버/코퍼 미만 제외)
-        # TSM 키: "CharName - Faction - ServerName" → "캐릭명-서버명" 형태로 변환
-        def _char_key(tsm_key: str) -> str:
-            parts = tsm_key.split(" - ")
-            if len(parts) == 3:
-                return f"{parts[0]}-{parts[2]}"
-            return tsm_key
-
-        characters = {
-            _char_key(k[len("char:"):]) : int(copper_to_gold(v))
-            for k, v in current_vals.items()
-            if k.startswith("char:")
-        }
+    # forward-fill 은 소스별 열로 이루어진 (날짜 × 소스) copper 행렬에서 한 번에 계산하고,
+    # 골드 환산도 열 단위로 벡터화한 뒤 마지막에만 날짜별 dict 로 조립한다.
+    # 보유량은 음수가 아니므로 정수 나눗셈으로 골드 미만을 버림
+    char_mat = _forward_fill(dates, list(char_sorted.values()))
+    wb_arr = _forward_fill(dates, [wb_sorted])[:, 0]
+    char_sum_arr = char_mat.sum(axis=1)
 
+    char_gold = (char_sum_arr // 10000).tolist()
+    wb_gold = (wb_arr // 10000).tolist()
+    total_gold = ((char_sum_arr + wb_arr) // 10000).tolist()
+    char_gold_rows = (char_mat // 10000).tolist()
+
+    history: dict[str, dict] = {}
+    for d, date_str in enumerate(dates):
         history[date_str] = {
-            "characters_gold": int(copper_to_gold(char_copper)),
-            "warbank_gold": int(copper_to_gold(wb_copper)),
-            "total_gold": int(copper_to_gold(total_copper)),
-            "characters": characters,
+            "characters_gold": char_gold[d],
+            "warbank_gold": wb_gold[d],
+            "total_gold": total_gold[d],
+            # 캐릭터별 상세 (정수 골드만 저장, 실버/코퍼 미만 제외)
+            "characters": dict(zip(char_labels, char_gold_rows[d])),
         }
 
     return history
 
 
 
-def save_gold_history(history: dict, output_dir: str) -> list[str]:
+def save_gold_history(
+    history: dict,
+    output_dir: str,
+    write_cache: dict | None = None,
+) -> list[str]:
     """
     일별 골드 이력을 output_dir/gold/YYYY/MM/DD.json 파일로 저장합니다.
     저장된 파일 경로 리스트를 반환합니다.
     """
-    saved = []
+    files = []
     for date_str, data in history.items():
         # date_str: "YYYY-MM-DD"
         yyyy, mm, dd = date_str.split("-")
-        day_dir = os.path.join(output_dir, "gold", yyyy, mm)
-        os.makedirs(day_dir, exist_ok=True)
-        path = os.path.join(day_dir, f"{dd}.json")
-        payload = {"date": date_str, **data}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        saved.append(path)
-    return saved
+        path = os.path.join(output_dir, "gold", yyyy, mm, f"{dd}.json")
+        files.append((path, {"date": date_str, **data}))
+    return _write_json_files(files, output_dir, write_cache)
 
 
 def print_gold_history(history: dict, n: int = 10) -> None:
@@ -335,11 +603,18 @@ def print_gold_history(history: dict, n: int = 10) -> None:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def parse_csv_records(csv_str: str) -> list[dict]:
+# csv(Income/Expense 등) 한 행. 행 수가 많으므로 dict 대신 namedtuple 로 보관
+# - date: 'YYYY-MM-DD' (UTC 기준), ts: Unix 타임스탬프(초), amount_copper: copper 단위 금액
+CsvRecord = namedtuple("CsvRecord", "date ts type other_player player amount_copper")
+
+
+def parse_csv_records(csv_str: str, seen: set | None = None) -> list[CsvRecord]:
     """
-    csv(Income/Expense 등) 문자열에서 모든 항목을 파싱하여 리스트로 반환합니다.
+    csv(Income/Expense 등) 문자열에서 모든 항목을 파싱하여 CsvRecord 리스트로 반환합니다.
     형식: type,amount,otherPlayer,player,time
     - amount 양수: 수입 (income), 음수: 지출 (expense)
+    - seen 이 주어지면 (time, type, otherPlayer, player) 가 이미 seen 에 있는 행은
+      레코드를 만들지 않고 건너뛰며, 새 행은 seen 에 추가합니다.
     """
     csv_str = csv_str.replace("\\n", "\n")
     lines = csv_str.strip().split("\n")
@@ -347,6 +622,9 @@ def parse_csv_records(csv_str: str) -> list[dict]:
         return []
 
     records = []
+    # 연속된 행은 대부분 같은 날짜이므로 직전 행의 날짜 문자열을 재사용
+    last_day = None
+    date_str = ""
     for line in lines[1:]:
         parts = line.split(",")
         if len(parts) != 5:
@@ -357,35 +635,54 @@ def parse_csv_records(csv_str: str) -> list[dict]:
             ts = int(time_str)
         except ValueError:
             continue
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-        records.append({
-            "date": dt.strftime("%Y-%m-%d"),
-            "date_compact": dt.strftime("%Y%m%d"),
-            "datetime": dt.isoformat(),
-            "type": rec_type,
-            "other_player": other_player,
-            "player": player,
-            "amount_copper": amount,
-            "amount_gold": round(copper_to_gold(amount), 4),
-        })
+        # 유형/플레이어명은 종류가 적고 반복되므로 intern 하여 같은 객체를 공유
+        rec_type = sys.intern(rec_type)
+        other_player = sys.intern(other_player)
+        player = sys.intern(player)
+        if seen is not None:
+            # date/datetime 은 ts 에서 파생되므로 정수 ts 로 대신 구분
+            uid = (ts, rec_type, other_player, player)
+            if uid in seen:
+                continue
+            seen.add(uid)
+        # datetime 객체 생성 없이 날짜 문자열은 캐시에서 가져옴
+        day = ts // 86400
+        if day != last_day:
+            date_str = _day_str(ts)
+            last_day = day
+        records.append(CsvRecord(date_str, ts, rec_type, other_player, player, amount))
     return records
 
 
+_ITEM_NAME_RE = re.compile(r'\|h\[(.+?)(?:\s*\|A:[^\|]*\|a)?\]')
+_ITEM_ID_RE = re.compile(r'\|Hitem:(\d+)')
+
+
 def _extract_item_name(item_link: str) -> str:
     """
     WoW 아이템 링크에서 아이템 이름을 추출합니다.
     형식: ....|h[아이템명 |A:...|a]|h|r  또는  ...|h[아이템명]|h|r
     """
-    m = re.search(r'\|h\[(.+?)(?:\s*\|A:[^\|]*\|a)?\]', item_link)
+    m = _ITEM_NAME_RE.search(item_link)
     return m.group(1).strip() if m else ""
 
 
 def _extract_item_id(item_link: str) -> int | None:
     """WoW 아이템 링크에서 itemID를 추출합니다."""
-    m = re.search(r'\|Hitem:(\d+)', item_link)
+    m = _ITEM_ID_RE.search(item_link)
     return int(m.group(1)) if m else None
 
 
+# CraftSim.lua 항목 패턴
+# 고객 키 패턴: ["고객명-서버명"] = { ... ["customer"] ... ["realm"] ... ["craftHistory"] ...  }
+_CUSTOMER_RE = re.compile(r'^\["([^"]+)"\] = \{\s*\n\s*\["chatHistory"\]', re.MULTILINE)
+_TIP_RE = re.compile(r'\["tip"\] = (\d+),')
+_ITEM_LINK_RE = re.compile(r'\["itemLink"\] = "([^"]+)",')
+_TIMESTAMP_RE = re.compile(r'\["timestamp"\] = (\d+),')
+_REALM_RE = re.compile(r'\["realm"\] = "([^"]+)",')
+_CUSTOMER_NAME_RE = re.compile(r'\["customer"\] = "([^"]+)",')
+
+
 def parse_craftsim_file(path: str) -> list[dict]:
     """
     CraftSim.lua 파일을 파싱하여 주문제작 이력 레코드 리스트를 반환합니다.
@@ -414,13 +711,13 @@ def parse_craftsim_file(path: str) -> list[dict]:
     반환 레코드 구조:
     {
         "date": "YYYY-MM-DD",
-        "date_compact": "YYYYMMDD",
         "datetime": "ISO-8601",
         "requester": "고객명-서버명",
         "requester_char": "고객명",
         "requester_server": "서버명",
         "item_name": "아이템 이름",
         "item_id": int | None,
+        "amount_copper": int,  # copper 단위 수수료
         "amount_gold": float,  # 소수점 4자리 골드
     }
     """
@@ -433,21 +730,9 @@ def parse_craftsim_file(path: str) -> list[dict]:
     records = []
 
     # customerHistoryDB.data 섹션에서 고객 항목을 순차 파싱
-    # 고객 키 패턴: ["고객명-서버명"] = { ... ["customer"] ... ["realm"] ... ["craftHistory"] ...  }
     # 각 항목의 경계는 다음 고객 키 또는 파일 끝으로 판단
-    customer_pattern = re.compile(
-        r'^\["([^"]+)"\] = \{\s*\n\s*\["chatHistory"\]',
-        re.MULTILINE
-    )
-
-    tip_pattern = re.compile(r'\["tip"\] = (\d+),')
-    item_link_pattern = re.compile(r'\["itemLink"\] = "([^"]+)",')
-    timestamp_pattern = re.compile(r'\["timestamp"\] = (\d+),')
-    realm_pattern = re.compile(r'\["realm"\] = "([^"]+)",')
-    customer_name_pattern = re.compile(r'\["customer"\] = "([^"]+)",')
-
     # 모든 고객 항목 위치 찾기
-    matches = list(customer_pattern.finditer(content))
+    matches = list(_CUSTOMER_RE.finditer(content))
 
     for i, match in enumerate(matches):
         key_str = match.group(1)  # "고객명-서버명"
@@ -456,8 +741,8 @@ def parse_craftsim_file(path: str) -> list[dict]:
         block = content[start:end]
 
         # customer 이름과 realm 추출
-        cname_m = customer_name_pattern.search(block)
-        realm_m = realm_pattern.search(block)
+        cname_m = _CUSTOMER_NAME_RE.search(block)
+        realm_m = _REALM_RE.search(block)
         requester_char = cname_m.group(1) if cname_m else key_str.rsplit("-", 1)[0]
         requester_server = realm_m.group(1) if realm_m else "_unknown"
         requester = key_str  # 원본 키 ("고객명-서버명")
@@ -471,7 +756,7 @@ def parse_craftsim_file(path: str) -> list[dict]:
         # craftHistory 내 개별 제작 항목 파싱
         # 각 항목은 { ... } 블록, tip/itemLink/timestamp 를 함께 추출
         # 항목 경계: 연속된 { }로 구분 → timestamp 기준으로 분할
-        ts_positions = [m.start() for m in timestamp_pattern.finditer(craft_block)]
+        ts_positions = [m.start() for m in _TIMESTAMP_RE.finditer(craft_block)]
 
         for j, ts_pos in enumerate(ts_positions):
             # 이 timestamp를 포함하는 블록의 시작 (직전 '{' 탐색)
@@ -479,9 +764,9 @@ def parse_craftsim_file(path: str) -> list[dict]:
             seg_end = ts_positions[j + 1] if j + 1 < len(ts_positions) else len(craft_block)
             seg = craft_block[seg_start:seg_end]
 
-            tip_m = tip_pattern.search(seg)
-            link_m = item_link_pattern.search(seg)
-            ts_m = timestamp_pattern.search(seg)
+            tip_m = _TIP_RE.search(seg)
+            link_m = _ITEM_LINK_RE.search(seg)
+            ts_m = _TIMESTAMP_RE.search(seg)
 
             if not ts_m:
                 continue
@@ -493,17 +778,17 @@ def parse_craftsim_file(path: str) -> list[dict]:
             dt = datetime.fromtimestamp(ts, tz=timezone.utc)
             records.append({
                 "date": dt.strftime("%Y-%m-%d"),
-                "date_compact": dt.strftime("%Y%m%d"),
                 "datetime": dt.isoformat(),
                 "requester": requester,
                 "requester_char": requester_char,
                 "requester_server": requester_server,
                 "item_name": _extract_item_name(item_link),
                 "item_id": _extract_item_id(item_link),
-                "amount_gold": round(copper_to_gold(tip_copper), 4),
+                "amount_copper": tip_copper,
+                "amount_gold": copper_to_gold(tip_copper),
             })
 
-    records.sort(key=lambda r: r["datetime"])
+    records.sort(key=itemgetter("datetime"))
     return records
 
 
@@ -512,9 +797,9 @@ def parse_craftsim_file(path: str) -> list[dict]:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def extract_transactions(raw: dict) -> dict:
+def extract_transactions(collected: dict) -> dict:
     """
-    모든 csvIncome 키에서 유형별 수입/지출을 수집하여 일별로 집계합니다.
+    collect_all() 로 분류된 모든 csvIncome/csvExpense 에서 유형별 수입/지출을 수집하여 일별로 집계합니다.
 
     반환 구조:
     {
@@ -534,95 +819,114 @@ def extract_transactions(raw: dict) -> dict:
         ...
     }
     """
-    # csvIncome(수입/일반) 및 csvExpense(지출/수리비 등) 패턴 모두 수집
-    pattern = re.compile(r"^r@(.+?)@internalData@(csvIncome|csvExpense)$")
     seen = set()
 
-    # 일별 유형별 집계
-    daily: dict[str, dict] = {}
-
-    for key, value in raw.items():
-        m = pattern.match(key)
-        if not m:
-            continue
-        if not isinstance(value, str):
-            continue
-        
-        source_type = m.group(2)  # "csvIncome" or "csvExpense"
-        
-        for rec in parse_csv_records(value):
-            uid = (rec["date"], rec["type"], rec["other_player"], rec["player"], rec["datetime"])
-            if uid in seen:
-                continue
-            seen.add(uid)
+    # 중복 제거된 레코드를 (유형, 날짜) 인덱스와 copper 열로 모은 뒤
+    # (유형 수, 날짜 수) 정수 copper 배열에 한 번에 합산하고, 마지막에 골드로 변환
+    day_ids: dict[str, int] = {}
+    type_ids: dict[str, int] = {}
+    day_col: list[int] = []
+    type_col: list[int] = []
+    income_col: list[bool] = []
+    copper_col: list[int] = []
+
+    for is_income, csv_str in collected["tx_csvs"]:
+        for rec in parse_csv_records(csv_str, seen):
+            day_col.append(day_ids.setdefault(rec.date, len(day_ids)))
+            type_col.append(type_ids.setdefault(rec.type, len(type_ids)))
+            income_col.append(is_income)
+            copper_col.append(abs(rec.amount_copper))
+
+    if not day_col:
+        return {}
 
-            d = rec["date"]
-            t = rec["type"]
-            gold = abs(rec["amount_gold"])
+    days = np.array(day_col, dtype=np.intp)
+    types = np.array(type_col, dtype=np.intp)
+    is_income_arr = np.array(income_col, dtype=bool)
+    coppers = np.array(copper_col, dtype=np.int64)
 
-            if d not in daily:
-                daily[d] = {"income_gold": 0.0, "expense_gold": 0.0, "by_type": {}}
-            if t not in daily[d]["by_type"]:
-                daily[d]["by_type"][t] = {"income_gold": 0.0, "expense_gold": 0.0, "count": 0}
+    shape = (len(type_ids), len(day_ids))
+    income = np.zeros(shape, dtype=np.int64)
+    expense = np.zeros(shape, dtype=np.int64)
+    count = np.zeros(shape, dtype=np.int64)
+    np.add.at(income, (types[is_income_arr], days[is_income_arr]), coppers[is_income_arr])
+    np.add.at(expense, (types[~is_income_arr], days[~is_income_arr]), coppers[~is_income_arr])
+    np.add.at(count, (types, days), 1)
 
-            if source_type == "csvIncome":
-                daily[d]["income_gold"] = round(daily[d]["income_gold"] + gold, 4)
-                daily[d]["by_type"][t]["income_gold"] = round(
-                    daily[d]["by_type"][t]["income_gold"] + gold, 4
-                )
-            else:  # csvExpense
-                daily[d]["expense_gold"] = round(daily[d]["expense_gold"] + gold, 4)
-                daily[d]["by_type"][t]["expense_gold"] = round(
-                    daily[d]["by_type"][t]["expense_gold"] + gold, 4
-                )
-            daily[d]["by_type"][t]["count"] += 1
+    # 날짜별 by_type 은 그 날 처음 등장한 순서대로 나열
+    first_seen = np.full(shape, len(day_col), dtype=np.int64)
+    np.minimum.at(first_seen, (types, days), np.arange(len(day_col)))
 
-    # net_gold 계산
-    for d, data in daily.items():
-        data["net_gold"] = round(data["income_gold"] - data["expense_gold"], 4)
+    type_names = list(type_ids)
+    income_totals = income.sum(axis=0).tolist()
+    expense_totals = expense.sum(axis=0).tolist()
 
-    return dict(sorted(daily.items()))
+    daily: dict[str, dict] = {}
+    for d in sorted(day_ids):
+        j = day_ids[d]
+        present = np.nonzero(count[:, j])[0]
+        present = present[np.argsort(first_seen[present, j])]
+        daily[d] = {
+            "income_gold": copper_to_gold(income_totals[j]),
+            "expense_gold": copper_to_gold(expense_totals[j]),
+            "by_type": {
+                type_names[i]: {
+                    "income_gold": copper_to_gold(int(income[i, j])),
+                    "expense_gold": copper_to_gold(int(expense[i, j])),
+                    "count": int(count[i, j]),
+                }
+                for i in present.tolist()
+            },
+            "net_gold": copper_to_gold(income_totals[j] - expense_totals[j]),
+        }
+    return daily
 
 
-def save_transactions(daily: dict, output_dir: str) -> list[str]:
+def save_transactions(
+    daily: dict,
+    output_dir: str,
+    write_cache: dict | None = None,
+) -> list[str]:
     """
     일별 수입/지출 정보를 output_dir/transactions/YYYY/MM/DD.json 파일로 저장합니다.
     저장된 파일 경로 리스트를 반환합니다.
     """
-    saved = []
+    files = []
     for date_str, data in daily.items():
         yyyy, mm, dd = date_str.split("-")
-        day_dir = os.path.join(output_dir, "transactions", yyyy, mm)
-        os.makedirs(day_dir, exist_ok=True)
-        path = os.path.join(day_dir, f"{dd}.json")
-        payload = {"date": date_str, **data}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        saved.append(path)
-    return saved
+        path = os.path.join(output_dir, "transactions", yyyy, mm, f"{dd}.json")
+        files.append((path, {"date": date_str, **data}))
+    return _write_json_files(files, output_dir, write_cache)
 
 
-def save_crafting_by_date(records: list[dict], output_dir: str) -> list[str]:
+def save_crafting_by_date(
+    records: list[dict],
+    output_dir: str,
+    write_cache: dict | None = None,
+) -> list[str]:
     """
     주문제작 날짜별로 output_dir/crafting/YYYY/MM/DD.json 저장.
     날짜는 주문제작이 기록된 일자 기준이며, 수수료는 골드 단위로 소수점 4자리까지 기록합니다.
+    records 는 parse_craftsim_file() 결과처럼 datetime 순으로 정렬되어 있어야 하며,
+    날짜별 그룹은 삽입 순서(= 날짜순)를 그대로 사용합니다.
     저장된 파일 경로 리스트를 반환합니다.
     """
+    # 날짜별 그룹과 수수료 합계(copper)를 한 번의 순회로 집계
     by_date: dict[str, list[dict]] = {}
+    total_copper: dict[str, int] = {}
     for rec in records:
-        by_date.setdefault(rec["date_compact"], []).append(rec)
-
-    saved = []
-    for date_compact, recs in sorted(by_date.items()):
-        yyyy, mm, dd = date_compact[:4], date_compact[4:6], date_compact[6:8]
-        day_dir = os.path.join(output_dir, "crafting", yyyy, mm)
-        os.makedirs(day_dir, exist_ok=True)
-        path = os.path.join(day_dir, f"{dd}.json")
-        total_gold = round(sum(r["amount_gold"] for r in recs), 4)
+        d = rec["date"]
+        by_date.setdefault(d, []).append(rec)
+        total_copper[d] = total_copper.get(d, 0) + rec["amount_copper"]
+
+    files = []
+    for date_str, recs in by_date.items():
+        yyyy, mm, dd = date_str.split("-")
+        path = os.path.join(output_dir, "crafting", yyyy, mm, f"{dd}.json")
         payload = {
-            "date": recs[0]["date"],
+            "date": date_str,
             "total_orders": len(recs),
-            "total_gold": total_gold,
+            "total_gold": copper_to_gold(total_copper[date_str]),
             "orders": [
                 {
                     "datetime": r["datetime"],
@@ -634,10 +938,8 @@ def save_crafting_by_date(records: list[dict], output_dir: str) -> list[str]:
                 for r in recs
             ],
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        saved.append(path)
-    return saved
+        files.append((path, payload))
+    return _write_json_files(files, output_dir, write_cache)
 
 
 def _parse_requester(requester: str) -> tuple[str, str]:
@@ -651,9 +953,12 @@ def _parse_requester(requester: str) -> tuple[str, str]:
     return "_unknown", requester.strip()
 
 
+_UNSAFE_NAME_RE = re.compile(r'[\\/:*?"<>|]')
+
+
 def _safe_name(name: str) -> str:
     """파일/디렉토리명에 사용할 수 없는 문자를 제거합니다."""
-    return re.sub(r'[\\/:*?"<>|]', "_", name)
+    return _UNSAFE_NAME_RE.sub("_", name)
 
 
 def load_crafting_records_from_files(output_dir: str) -> list[dict]:
@@ -707,11 +1012,15 @@ def load_crafting_records_from_files(output_dir: str) -> list[dict]:
                     "item_id": order.get("item_id"),
                     "amount_gold": order.get("amount_gold", 0.0),
                 })
-    records.sort(key=lambda r: r["datetime"])
+    records.sort(key=itemgetter("datetime"))
     return records
 
 
-def save_crafting_by_requester(records: list[dict], output_dir: str) -> list[str]:
+def save_crafting_by_requester(
+    records: list[dict],
+    output_dir: str,
+    write_cache: dict | None = None,
+) -> list[str]:
     """
     주문제작 요청자별로 output_dir/crafting/서버명/캐릭명.json 저장.
     - records는 load_crafting_records_from_files()로 읽은 전체 누적 이력을 사용.
@@ -720,26 +1029,26 @@ def save_crafting_by_requester(records: list[dict], output_dir: str) -> list[str
     """
     crafting_dir = os.path.join(output_dir, "crafting")
 
+    # 요청자별 그룹과 수수료 합계를 한 번의 순회로 집계
     by_requester: dict[str, list[dict]] = {}
+    total_gold: dict[str, float] = {}
     for rec in records:
-        by_requester.setdefault(rec["requester"], []).append(rec)
+        req = rec["requester"]
+        by_requester.setdefault(req, []).append(rec)
+        total_gold[req] = total_gold.get(req, 0.0) + rec["amount_gold"]
 
-    saved = []
+    files = []
     for requester, recs in sorted(by_requester.items()):
         server = recs[0].get("requester_server", "_unknown")
         char = recs[0].get("requester_char", requester)
 
-        server_dir = os.path.join(crafting_dir, _safe_name(server))
-        os.makedirs(server_dir, exist_ok=True)
-        path = os.path.join(server_dir, f"{_safe_name(char)}.json")
-
-        total_gold = round(sum(r["amount_gold"] for r in recs), 4)
+        path = os.path.join(crafting_dir, _safe_name(server), f"{_safe_name(char)}.json")
         payload = {
             "requester": requester,
             "server": server,
             "character": char,
             "total_orders": len(recs),
-            "total_gold": total_gold,
+            "total_gold": round(total_gold[requester], 4),
             "orders": [
                 {
                     "date": r["date"],
@@ -751,10 +1060,8 @@ def save_crafting_by_requester(records: list[dict], output_dir: str) -> list[str
                 for r in recs
             ],
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        saved.append(path)
-    return saved
+        files.append((path, payload))
+    return _write_json_files(files, output_dir, write_cache)
 
 
 def print_crafting_summary(records: list[dict], n: int = 10) -> None:
@@ -763,10 +1070,8 @@ def print_crafting_summary(records: list[dict], n: int = 10) -> None:
         print("\n[주문제작 이력] 데이터 없음")
         return
 
-    total_gold = sum(r["amount_gold"] for r in records)
-    print(f"\n[주문제작 이력 요약] 총 {len(records)}건 / {total_gold:,.0f} G")
-
-    # 요청자별 통계
+    # 전체 합계와 요청자별 통계를 한 번의 순회로 집계
+    total_gold = 0.0
     by_req: dict[str, dict] = {}
     for rec in records:
         req = rec["requester"]
@@ -774,11 +1079,14 @@ def print_crafting_summary(records: list[dict], n: int = 10) -> None:
             by_req[req] = {"count": 0, "gold": 0.0}
         by_req[req]["count"] += 1
         by_req[req]["gold"] += rec["amount_gold"]
+        total_gold += rec["amount_gold"]
+
+    print(f"\n[주문제작 이력 요약] 총 {len(records)}건 / {total_gold:,.0f} G")
 
     print(f"\n[요청자 TOP {n}]")
     print(f"  {'요청자':<30} {'건수':>6} {'수익':>16}")
     print("  " + "-" * 56)
-    top = sorted(by_req.items(), key=lambda x: -x[1]["gold"])[:n]
+    top = heapq.nlargest(n, by_req.items(), key=lambda x: x[1]["gold"])
     for req, stat in top:
         print(
             f"  {req:<30} {stat['count']:>6}건"
@@ -819,22 +1127,41 @@ def generate_chart(
         print("[차트] 데이터가 없어 차트를 생성하지 않습니다.")
         return ""
 
-    dates = [datetime.strptime(d, "%Y-%m-%d") for d in all_dates]
+    # "YYYY-MM-DD" 고정 형식이므로 strptime 대신 슬라이스로 직접 변환
+    dates = [datetime(int(d[:4]), int(d[5:7]), int(d[8:10])) for d in all_dates]
     total_gold = [gold_history.get(d, {}).get("total_gold", 0) for d in all_dates]
 
     # 모든 거래 유형 수집
-    income_types = sorted({t for d in all_dates for t in daily_transactions.get(d, {}).get("by_type", {})
-                           if daily_transactions[d]["by_type"][t].get("income_gold", 0) > 0})
-    expense_types = sorted({t for d in all_dates for t in daily_transactions.get(d, {}).get("by_type", {})
-                            if daily_transactions[d]["by_type"][t].get("expense_gold", 0) > 0})
-
-    # 유형별 시계열 데이터 준비
-    income_data = {t: [daily_transactions.get(d, {}).get("by_type", {}).get(t, {}).get("income_gold", 0.0)
-                       for d in all_dates] for t in income_types}
-    expense_data = {t: [daily_transactions.get(d, {}).get("by_type", {}).get(t, {}).get("expense_gold", 0.0)
-                        for d in all_dates] for t in expense_types}
-
-    fig, axes = plt.subplots(3, 1, figsize=(14, 12), sharex=True,
+    income_types_set: set[str] = set()
+    expense_types_set: set[str] = set()
+    for info in daily_transactions.values():
+        for t, v in info.get("by_type", {}).items():
+            if v.get("income_gold", 0) > 0:
+                income_types_set.add(t)
+            if v.get("expense_gold", 0) > 0:
+                expense_types_set.add(t)
+    income_types = sorted(income_types_set)
+    expense_types = sorted(expense_types_set)
+
+    # 유형별 시계열 데이터 준비: (유형 수, 날짜 수) 배열을 한 번의 순회로 채움
+    date_idx = {d: i for i, d in enumerate(all_dates)}
+    income_idx = {t: i for i, t in enumerate(income_types)}
+    expense_idx = {t: i for i, t in enumerate(expense_types)}
+    income_data = np.zeros((len(income_types), len(all_dates)))
+    expense_data = np.zeros((len(expense_types), len(all_dates)))
+    for d, info in daily_transactions.items():
+        j = date_idx[d]
+        for t, v in info.get("by_type", {}).items():
+            i = income_idx.get(t)
+            if i is not None:
+                income_data[i, j] = v.get("income_gold", 0.0)
+            i = expense_idx.get(t)
+            if i is not None:
+                expense_data[i, j] = v.get("expense_gold", 0.0)
+
+    # 축 눈금/라벨, 축 바깥 범례 크기에 맞춰 여백을 잡도록 constrained 레이아웃 사용
+    # (tight_layout / bbox_inches="tight" 와 달리 저장 시 렌더링을 한 번 더 하지 않음)
+    fig, axes = plt.subplots(3, 1, figsize=(14, 12), sharex=True, layout="constrained",
                              gridspec_kw={"height_ratios": [3, 2, 2]})
     fig.patch.set_facecolor("#1a1a2e")
 
@@ -842,7 +1169,7 @@ def generate_chart(
 
     # ── 상단 (ax_gold): 총 골드 보유량 ──
     ax_gold.set_facecolor("#16213e")
-    ax_gold.fill_between(dates, total_gold, alpha=0.35, color="#ffd700", linewidth=0)
+    ax_gold.fill_between(dates, total_gold, alpha=0.35, color="#ffd700", linewidth=0, rasterized=True)
     ax_gold.plot(dates, total_gold, color="#ffd700", linewidth=1.8, label="총 골드")
     ax_gold.set_ylabel("보유 골드 (G)", color="#e0e0e0", fontsize=10)
     ax_gold.tick_params(colors="#e0e0e0")
@@ -854,8 +1181,7 @@ def generate_chart(
     # ── 중단 (ax_income): 유형별 수입 누적 차트 ──
     ax_income.set_facecolor("#16213e")
     if income_types:
-        stacks = [income_data[t] for t in income_types]
-        ax_income.stackplot(dates, *stacks, labels=income_types, alpha=0.75)
+        ax_income.stackplot(dates, income_data, labels=income_types, alpha=0.75, rasterized=True)
     ax_income.set_ylabel("수입 (G)", color="#e0e0e0", fontsize=10)
     ax_income.tick_params(colors="#e0e0e0")
     ax_income.yaxis.set_major_formatter(FuncFormatter(lambda v, _: f"{v:,.0f}G"))
@@ -866,8 +1192,7 @@ def generate_chart(
     # ── 하단 (ax_expense): 유형별 지출 누적 차트 ──
     ax_expense.set_facecolor("#16213e")
     if expense_types:
-        stacks = [expense_data[t] for t in expense_types]
-        ax_expense.stackplot(dates, *stacks, labels=expense_types, alpha=0.75, colors=plt.cm.Reds(np.linspace(0.4, 0.8, len(expense_types))))
+        ax_expense.stackplot(dates, expense_data, labels=expense_types, alpha=0.75, colors=plt.cm.Reds(np.linspace(0.4, 0.8, len(expense_types))), rasterized=True)
     ax_expense.set_ylabel("지출 (G)", color="#e0e0e0", fontsize=10)
     ax_expense.tick_params(colors="#e0e0e0")
     ax_expense.yaxis.set_major_formatter(FuncFormatter(lambda v, _: f"{v:,.0f}G"))
@@ -880,12 +1205,9 @@ def generate_chart(
     ax_expense.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=5, maxticks=10))
     plt.setp(ax_expense.xaxis.get_majorticklabels(), rotation=30, ha="right", color="#e0e0e0")
 
-    plt.tight_layout()
-    plt.subplots_adjust(right=0.85, hspace=0.3)
-
     out_path = os.path.join(output_dir, "transactions.png")
     os.makedirs(output_dir, exist_ok=True)
-    plt.savefig(out_path, dpi=150, bbox_inches="tight", facecolor=fig.get_facecolor())
+    plt.savefig(out_path, dpi=120, facecolor=fig.get_facecolor())
     plt.close(fig)
     return out_path
 
@@ -961,11 +1283,15 @@ def main() -> None:
 
     print(f"Lua 파일 읽는 중: {args.lua_path}")
     raw = parse_lua_file(args.lua_path)
+    collected = collect_all(raw)
+
+    # 이전 실행에서 저장한 파일별 해시 (내용이 같은 파일은 다시 쓰지 않음)
+    write_cache = load_write_cache(args.output_path)
 
     # 일별 골드 이력 추출 및 저장
     print("일별 골드 이력 추출 중...")
-    history = extract_daily_gold_history(raw)
-    gold_files = save_gold_history(history, args.output_path)
+    history = extract_daily_gold_history(collected)
+    gold_files = save_gold_history(history, args.output_path, write_cache)
     print(f"골드 이력 저장 완료: {len(gold_files)}개 파일 (output/gold/)")
 
     # 주문제작 이력 추출 및 저장 (CraftSim)
@@ -973,7 +1299,7 @@ def main() -> None:
     if args.craftsim_path:
         print(f"CraftSim 파일 읽는 중: {args.craftsim_path}")
         crafting_records = parse_craftsim_file(args.craftsim_path)
-        date_files = save_crafting_by_date(crafting_records, args.output_path)
+        date_files = save_crafting_by_date(crafting_records, args.output_path, write_cache)
         print(f"날짜별 저장 완료: {len(date_files)}개 파일 (output/crafting/)")
     else:
         print("CRAFTSIM_PATH 미설정 → 주문제작 이력 처리 건너뜀")
@@ -981,13 +1307,13 @@ def main() -> None:
     # 요청자별 파일 생성: 누적된 날짜별 JSON 파일을 원본으로 사용 (6.4)
     print("요청자별 이력 집계 중 (crafting/YYYY/MM/DD.json 기준)...")
     all_crafting_records = load_crafting_records_from_files(args.output_path)
-    req_files = save_crafting_by_requester(all_crafting_records, args.output_path)
+    req_files = save_crafting_by_requester(all_crafting_records, args.output_path, write_cache)
     print(f"요청자별 저장 완료: {len(req_files)}개 파일 (output/crafting/)")
 
     # 수입/지출 이력 추출 및 저장
     print("수입/지출 이력 추출 중...")
-    daily_tx = extract_transactions(raw)
-    tx_files = save_transactions(daily_tx, args.output_path)
+    daily_tx = extract_transactions(collected)
+    tx_files = save_transactions(daily_tx, args.output_path, write_cache)
     print(f"수입/지출 저장 완료: {len(tx_files)}개 파일 (output/transactions/)")
 
     # 차트 생성
@@ -996,6 +1322,8 @@ def main() -> None:
     if chart_path:
         print(f"차트 저장 완료: {chart_path}")
 
+    save_write_cache(write_cache, args.output_path)
+
     # 요약 출력
     print_gold_history(history)
     print_crafting_summary(crafting_records)